@@ -16,33 +16,43 @@ This module streams tokens, detects completed sections, and yields them.
 from __future__ import annotations
 
 import json
-import re
 from dataclasses import dataclass, field
 from typing import AsyncIterator
 import openai
+from pydantic import TypeAdapter, ValidationError
 
 import json_repair
+import orjson
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from agents.client import get_heavy_model
 from agents.language import language_instruction
 from agents.prompt_loader import render
-from agents.schemas import WorldGenSchema
+from agents.schemas import WORLD_ADAPTER, WorldGenSchema
 from game.cost import CostTracker
 
 
-SECTION_ORDER = [
+SECTION_ORDER = (
     "world_core",
     "player_and_stats",
     "npcs_and_relationships",
     "tags",
     "story",
     "seasons",
-]
+)
 
 TOTAL_SECTIONS = len(SECTION_ORDER)
 
+# One validator per top-level world field, so each section can be checked as
+# it arrives instead of revalidating the whole world at the end.
+_FIELD_ADAPTERS = {
+    name: TypeAdapter(info.annotation) for name, info in WorldGenSchema.model_fields.items()
+}
+_REQUIRED_FIELDS = frozenset(
+    name for name, info in WorldGenSchema.model_fields.items() if info.is_required()
+)
+
 
 @dataclass
 class StreamSection:
@@ -58,33 +68,83 @@ class StreamSection:
 class _ParserState:
     """Accumulator for the streaming parser."""
 
-    buffer: str = ""
+    buffer: str = ""  # Unparsed tail of the stream (consumed text is dropped)
     sections: list[StreamSection] = field(default_factory=list)
     _scan_pos: int = 0  # Position in buffer we've already parsed up to
+    _parts: list[str] = field(default_factory=list)  # Chunks not yet joined into buffer
 
     def feed(self, chunk: str) -> list[StreamSection]:
-        """Feed a chunk of streamed text. Returns any newly completed sections."""
-        self.buffer += chunk
+        """Feed a chunk of streamed text. Returns any newly completed sections.
+
+        A section can only complete on the chunk carrying its closing fence,
+        so the scan is skipped for chunks without a backtick.
+        """
+        self._parts.append(chunk)
+        if "`" not in chunk:
+            return []
         return self._try_parse()
 
     def finalize(self) -> list[StreamSection]:
         """Flush any remaining section in the buffer."""
         return self._try_parse()
 
-    def _try_parse(self) -> list[StreamSection]:
-        new_sections: list[StreamSection] = []
+    def _join_parts(self) -> None:
+        """Append pending chunks to the unparsed tail, discarding consumed text.
 
-        # Pattern: # Title\n```json\n{...}\n```
-        pattern = r"#\s*(.+?)\s*\n\s*```json\s*\n(.*?)```"
+        Avoids ``buffer += chunk`` on every token, which copies the whole
+        response each time.
+        """
+        if not self._parts:
+            return
+        self.buffer = self.buffer[self._scan_pos:] + "".join(self._parts)
+        self._parts.clear()
+        self._scan_pos = 0
+
+    def _try_parse(self) -> list[StreamSection]:
+        """Extract every complete ``# Title`` + fenced JSON block after ``_scan_pos``.
 
-        for match in re.finditer(pattern, self.buffer[self._scan_pos:], re.DOTALL):
-            title = match.group(1).strip()
-            json_str = match.group(2).strip()
-            section_idx = len(self.sections) + len(new_sections)
+        Delimiters are fixed literals, so plain ``str.find`` locates them without
+        regex backtracking over incomplete sections.
+        """
+        self._join_parts()
+        new_sections: list[StreamSection] = []
+        buf = self.buffer
+        # Local bindings keep the per-token scan free of attribute lookups.
+        find = buf.find
+        pos = self._scan_pos
+        section_idx = len(self.sections)
+
+        while True:
+            # Heading: "# Title\n"
+            h = find("#", pos)
+            if h == -1:
+                break
+            title_end = find("\n", h)
+            if title_end == -1:
+                break
+            # Opening fence and the newline that ends it
+            j = find("```json", title_end)
+            if j == -1:
+                break
+            body = find("\n", j + 7)
+            if body == -1:
+                break
+            # Closing fence
+            k = find("```", body)
+            if k == -1:
+                break
+
+            title = buf[h:title_end].lstrip("#").strip()
+            json_str = buf[body + 1:k].strip()
+            # Advance scan position past the closing fence (absolute offset)
+            pos = k + 3
 
             try:
-                data = json_repair.loads(json_str)
-                key = SECTION_ORDER[section_idx] if section_idx < len(SECTION_ORDER) else f"extra_{section_idx}"
+                try:
+                    data = orjson.loads(json_str)
+                except orjson.JSONDecodeError:
+                    data = json_repair.repair_json(json_str, skip_json_loads=True, return_objects=True)
+                key = SECTION_ORDER[section_idx] if section_idx < TOTAL_SECTIONS else f"extra_{section_idx}"
                 section = StreamSection(
                     index=section_idx,
                     key=key,
@@ -92,27 +152,66 @@ class _ParserState:
                     data=data,
                 )
                 new_sections.append(section)
-                # Advance scan position past this match
-                self._scan_pos += match.end()
+                section_idx += 1
             except (json.JSONDecodeError, IndexError):
                 continue
 
+        self._scan_pos = pos
         self.sections.extend(new_sections)
         return new_sections
 
 
-def _assemble_world(sections: list[StreamSection]) -> WorldGenSchema:
-    """Assemble completed sections into a WorldGenSchema."""
+def _validate_section(data: dict) -> dict | None:
+    """Validate the world fields in one section's data.
+
+    Returns the validated values, or None if the section is not a dict or any
+    field fails — final assembly then revalidates everything and reports it.
+    """
+    if not isinstance(data, dict):
+        return None
+    validated: dict = {}
+    try:
+        for name, value in data.items():
+            adapter = _FIELD_ADAPTERS.get(name)
+            if adapter is not None:
+                validated[name] = adapter.validate_python(value)
+    except ValidationError:
+        return None
+    return validated
+
+
+def _merge_validated(validated: dict | None, section: StreamSection) -> dict | None:
+    """Fold one section into the running validated fields (None stays None)."""
+    if validated is None:
+        return None
+    fields = _validate_section(section.data)
+    if fields is None:
+        return None
+    validated.update(fields)
+    return validated
+
+
+def _assemble_world(
+    sections: list[StreamSection],
+    validated: dict | None = None,
+) -> WorldGenSchema:
+    """Assemble completed sections into a WorldGenSchema.
+
+    ``validated`` holds fields already checked by ``_validate_section``; when it
+    covers every required field the world is built without revalidation.
+    """
     if not sections:
         raise RuntimeError(
             "Architect returned no parseable sections. "
             "The LLM response may have been empty or malformed. "
             "Please retry."
         )
+    if validated is not None and _REQUIRED_FIELDS <= validated.keys():
+        return WorldGenSchema.model_construct(**validated)
     merged: dict = {}
     for section in sections:
         merged.update(section.data)
-    return WorldGenSchema(**merged)
+    return WORLD_ADAPTER.validate_python(merged)
 
 
 async def stream_world(
@@ -144,16 +243,17 @@ async def stream_world(
     ]
 
     parser = _ParserState()
-    full_response = ""
+    validated: dict | None = {}  # None once any section fails early validation
+    output_chars = 0  # Only the length is needed, so don't keep a copy of the text
 
     try:
         async for chunk in model.astream(messages):
-            token = chunk.content if hasattr(chunk, "content") else str(chunk)
-            if not token:
+            if not (token := getattr(chunk, "content", "")):
                 continue
-            full_response += token
+            output_chars += len(token)
             new_sections = parser.feed(token)
             for section in new_sections:
+                validated = _merge_validated(validated, section)
                 yield section
     except openai.APIError as e:
         # Check if we got any sections at all before failing
@@ -164,6 +264,7 @@ async def stream_world(
     # Finalize any remaining section
     remaining = parser.finalize()
     for section in remaining:
+        validated = _merge_validated(validated, section)
         yield section
 
     # Track cost if available
@@ -171,9 +272,9 @@ async def stream_world(
         # Approximate token count from response length
         cost_tracker.record_manual(
             input_chars=len(system_prompt) + len(user_prompt),
-            output_chars=len(full_response),
+            output_chars=output_chars,
             label="Architect (streaming)",
         )
 
     # Assemble and yield final WorldGenSchema
-    yield _assemble_world(parser.sections)
+    yield _assemble_world(parser.sections, validated)
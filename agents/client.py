@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 
@@ -23,7 +24,9 @@ def _get_api_key() -> str:
     return key
 
 
+@functools.lru_cache(maxsize=1)
 def get_heavy_model() -> ChatOpenAI:
+    """Shared Architect client — cached so its HTTP connection pool is reused."""
     return ChatOpenAI(
         model=os.getenv("HEAVY_MODEL", "google/gemini-2.5-pro"),
         api_key=_get_api_key(),
@@ -33,7 +36,9 @@ def get_heavy_model() -> ChatOpenAI:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_fast_model() -> ChatOpenAI:
+    """Shared Writer client — cached so its HTTP connection pool is reused."""
     return ChatOpenAI(
         model=os.getenv("FAST_MODEL", "google/gemini-2.5-flash"),
         api_key=_get_api_key(),
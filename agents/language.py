@@ -8,13 +8,7 @@ LANGUAGE_MAP = {
 }
 
 
-def language_instruction(lang_code: str) -> str:
-    """Return language instruction for AI prompts.
-
-    CRITICAL: All internal identifiers (tags, IDs, stat_check keys, node IDs,
-    event IDs) MUST always be in English regardless of language setting.
-    Only user-facing display text should be in the target language.
-    """
+def _build_instruction(lang_code: str) -> str:
     lang_name = LANGUAGE_MAP.get(lang_code, "English")
     if lang_code == "en":
         return "Write all text in English."
@@ -29,3 +23,18 @@ def language_instruction(lang_code: str) -> str:
         f"- Event IDs\n"
         f"- chain_tag values"
     )
+
+
+# Instructions are fixed per language, so build them once at import.
+_INSTRUCTION_CACHE: dict[str, str] = {code: _build_instruction(code) for code in LANGUAGE_MAP}
+_UNKNOWN_INSTRUCTION = _build_instruction("")
+
+
+def language_instruction(lang_code: str) -> str:
+    """Return language instruction for AI prompts.
+
+    CRITICAL: All internal identifiers (tags, IDs, stat_check keys, node IDs,
+    event IDs) MUST always be in English regardless of language setting.
+    Only user-facing display text should be in the target language.
+    """
+    return _INSTRUCTION_CACHE.get(lang_code, _UNKNOWN_INSTRUCTION)
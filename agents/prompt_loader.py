@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
@@ -14,8 +15,26 @@ _env = Environment(
     lstrip_blocks=True,
 )
 
+# Compile the known templates up front so the first render doesn't pay for it.
+for _name in (
+    "architect_system.j2",
+    "architect_user.j2",
+    "writer_system.j2",
+    "writer_user_static.j2",
+    "writer_user_dynamic.j2",
+):
+    _env.get_template(_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_static(template_name: str) -> str:
+    """Render a template that takes no variables (the output never changes)."""
+    return _env.get_template(template_name).render().strip()
+
 
 def render(template_name: str, **kwargs) -> str:
     """Render a prompt template with the given variables."""
+    if not kwargs:
+        return _render_static(template_name)
     tpl = _env.get_template(template_name)
     return tpl.render(**kwargs).strip()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ── Function Call ───────────────────────────────────────────────────────────
@@ -202,3 +202,10 @@ class WriterBatchOutput(BaseModel):
         description="All generated cards: common + job cards in a single list. "
         "Use type='choice' for cards with decisions, type='info' for read-only cards."
     )
+
+
+# Validators for the two top-level LLM outputs, compiled once and shared by
+# every caller. Building them needs the card definitions above to be fully
+# rebuilt, which is why those rebuilds run at import rather than lazily.
+WRITER_ADAPTER = TypeAdapter(WriterBatchOutput)
+WORLD_ADAPTER = TypeAdapter(WorldGenSchema)
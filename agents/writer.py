@@ -1,17 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from agents.client import get_fast_model
 from agents.language import language_instruction
 from agents.prompt_loader import render
-from agents.schemas import CardDef, WriterBatchOutput
+from agents.schemas import WRITER_ADAPTER, CardDef, WriterBatchOutput
 from game.cost import CostTracker
 from game.job_queue import CardGenJob
 import json_repair
-import re
+import orjson
 from langchain_core.output_parsers import PydanticOutputParser
 
+# The output schema never changes, so render its format instructions once.
+_FORMAT_INSTRUCTIONS = PydanticOutputParser(pydantic_object=WriterBatchOutput).get_format_instructions()
+_OUTPUT_SUFFIX = (
+    f"\n\nOUTPUT FORMAT REQUIREMENTS:\n{_FORMAT_INSTRUCTIONS}\n\n"
+    "Note: Return ONLY the JSON object, wrapped in ```json ... ``` fences. "
+    "Pay close attention to the required field names like 'title' (NOT 'name')."
+)
+
+
+
+def _extract_fenced_json(raw: str) -> str | None:
+    """Return the body of the first ```json (or bare ```) block, or None.
+
+    The fences are fixed strings, so ``str.find`` locates them without running
+    a backtracking regex over the whole response.
+    """
+    find = raw.find
+    start = find("```")
+    while start != -1:
+        body = start + 3
+        if raw.startswith("json", body):
+            body += 4
+        # Only whitespace may follow the opening fence, ending in a newline.
+        ws_end = body
+        while ws_end < len(raw) and raw[ws_end].isspace():
+            ws_end += 1
+        newline = raw.rfind("\n", body, ws_end)
+        if newline != -1:
+            end = find("```", newline + 1)
+            if end != -1:
+                return raw[newline + 1:end]
+        start = find("```", start + 1)
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _static_prefix(world_context: str, stat_names: tuple[str, ...], language: str) -> tuple[str, str]:
+    """Render the week-invariant ``(system_prompt, static_user_prefix)`` pair."""
+    system_prompt = render("writer_system.j2")
+    static_user_prefix = render(
+        "writer_user_static.j2",
+        language_instruction=language_instruction(language),
+        world_context=world_context,
+        stat_names=list(stat_names),
+    )
+    return system_prompt, static_user_prefix
+
+
 class Writer:
     def __init__(
         self,
@@ -27,20 +79,18 @@ class Writer:
         self.cost_tracker = cost_tracker
         self.language = language
 
-    async def generate_batch(
-        self,
-        common_count: int,
-        jobs: list[CardGenJob],
-        context: dict,
-    ) -> WriterBatchOutput:
-        """Generate a unified batch: m common cards + 1 card per job."""
-        lang_note = language_instruction(self.language)
+        # Week-invariant prompt prefix: rendered once, and keyed so the
+        # provider can reuse its prompt cache across weekly calls.
+        self._system_prompt, self._static_user_prefix = _static_prefix(
+            self.world_context, tuple(self.stat_names), language
+        )
+        prefix_hash = hashlib.sha1(self._static_user_prefix.encode("utf-8")).hexdigest()[:16]
+        self._prompt_cache_key = f"writer-static-{prefix_hash}"
 
-        system_prompt = render("writer_system.j2")
-        user_prompt = render(
-            "writer_user.j2",
-            language_instruction=lang_note,
-            world_context=self.world_context,
+    def _user_prompt(self, common_count: int, jobs: list[CardGenJob], context: dict) -> str:
+        """Static prefix + this week's state + output format requirements."""
+        user_prompt = self._static_user_prefix + "\n" + render(
+            "writer_user_dynamic.j2",
             stat_names=self.stat_names,
             is_season_start=context.get("is_season_start", False),
             is_first_day_after_death=context.get("is_first_day_after_death", False),
@@ -54,26 +104,63 @@ class Writer:
             common_count=common_count,
             jobs=jobs,
         )
+        return user_prompt + _OUTPUT_SUFFIX
 
-        parser = PydanticOutputParser(pydantic_object=WriterBatchOutput)
-        user_prompt += f"\n\nOUTPUT FORMAT REQUIREMENTS:\n{parser.get_format_instructions()}\n\nNote: Return ONLY the JSON object, wrapped in ```json ... ``` fences. Pay close attention to the required field names like 'title' (NOT 'name')."
+    async def generate_batch(
+        self,
+        common_count: int,
+        jobs: list[CardGenJob],
+        context: dict,
+    ) -> WriterBatchOutput:
+        """Generate a unified batch: m common cards + 1 card per job."""
+        user_prompt = self._user_prompt(common_count, jobs, context)
 
         messages = [
-            SystemMessage(content=system_prompt),
+            SystemMessage(content=self._system_prompt),
             HumanMessage(content=user_prompt),
         ]
 
-        result = await self.chain.ainvoke(messages)
+        result = await self.chain.ainvoke(
+            messages,
+            extra_body={"prompt_cache_key": self._prompt_cache_key},
+        )
         
         # Extract JSON from markdown fences if present
         raw_content = result.content
-        json_match = re.search(r'```(?:json)?\s*\n(.*?)```', raw_content, re.DOTALL)
-        json_str = json_match.group(1).strip() if json_match else raw_content.strip()
+        fenced = _extract_fenced_json(raw_content)
+        json_str = fenced.strip() if fenced is not None else raw_content.strip()
         
         # Repair and parse JSON gracefully
-        repaired_dict = json_repair.repair_json(json_str, return_objects=True)
-        parsed = WriterBatchOutput.model_validate(repaired_dict)
+        try:
+            repaired_dict = orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            repaired_dict = json_repair.repair_json(json_str, skip_json_loads=True, return_objects=True)
+        parsed = WRITER_ADAPTER.validate_python(repaired_dict)
         
         if self.cost_tracker:
             self.cost_tracker.record_from_raw(result, label="Writer")
         return parsed
+
+    async def generate_batch_parallel(
+        self,
+        common_count: int,
+        jobs: list[CardGenJob],
+        context: dict,
+    ) -> WriterBatchOutput:
+        """Like ``generate_batch``, but with one concurrent call per job.
+
+        The common cards (and any season initialization cards) come from one
+        call and each job from its own, so shorter outputs overlap instead of
+        being generated back to back. Falls back to a single call for fewer
+        than two jobs, where splitting gains nothing.
+        """
+        if len(jobs) < 2:
+            return await self.generate_batch(common_count, jobs, context)
+
+        # Season initialization cards belong to the common call only.
+        job_context = {**context, "is_season_start": False}
+        batches = await asyncio.gather(
+            self.generate_batch(common_count, [], context),
+            *(self.generate_batch(0, [job], job_context) for job in jobs),
+        )
+        return WriterBatchOutput(cards=[cd for batch in batches for cd in batch.cards])
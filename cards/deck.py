@@ -1,7 +1,8 @@
 """Priority-weighted card deck used by the game engine.
 
-``WeightedDeque`` stores cards sorted by priority so the highest-priority card
-is always drawn first (O(n) insert via bisect, O(1) draw from the tail).
+``WeightedDeque`` keeps cards in a binary heap keyed on priority so the
+highest-priority card is always drawn first (O(log n) insert and draw). Cards
+of equal priority are drawn in insertion order.
 
 Priority levels (defined in ``cards.validator``):
   5 = story  (death / reborn / welcome)
@@ -17,7 +18,9 @@ so that plot/event/tree/story cards are never lost.
 
 from __future__ import annotations
 
-import bisect
+import heapq
+import itertools
+from collections.abc import Iterator
 
 from cards.models import Card, CardBase, ChoiceCard, InfoCard
 
@@ -30,58 +33,106 @@ class WeightedDeque:
 
     Eviction policy: when over capacity, evict the lowest-priority common cards.
     Non-common cards (plot, event, tree, story) are never evicted.
+
+    Cards live in a heap of ``(-priority, seq, card)``; common cards are also
+    pushed onto a second heap keyed on eviction order. Evicted cards are only
+    tombstoned and are skipped (lazily deleted) when popped from the main heap.
     """
 
     def __init__(self, capacity: int = 10) -> None:
-        self._cards: list[Card] = []
+        self._heap: list[tuple[int, int, Card]] = []
+        # (priority, -seq, card): lowest priority first, newest first on ties.
+        self._common_heap: list[tuple[int, int, Card]] = []
+        self._live_commons: set[int] = set()  # seq of commons still drawable
+        self._evicted: set[int] = set()  # seq of tombstoned entries in _heap
+        self._seq = itertools.count()
         self.capacity = capacity
         self.cards_consumed: int = 0
 
     def draw(self) -> Card | None:
         """Remove and return the highest-priority card, or None if empty."""
-        if not self._cards:
-            return None
-        card = self._cards.pop()
-        self.cards_consumed += 1
-        return card
+        heap = self._heap
+        evicted = self._evicted
+        while heap:
+            _, seq, card = heapq.heappop(heap)
+            if seq in evicted:
+                evicted.discard(seq)
+                continue
+            self._live_commons.discard(seq)
+            self.cards_consumed += 1
+            return card
+        return None
+
+    def _push(self, card: Card) -> None:
+        seq = next(self._seq)
+        heapq.heappush(self._heap, (-card.priority, seq, card))
+        if card.source == "common":
+            heapq.heappush(self._common_heap, (card.priority, -seq, card))
+            self._live_commons.add(seq)
 
     def insert(self, card: Card) -> None:
-        """Insert a single card in priority order using bisect."""
-        priorities = [c.priority for c in self._cards]
-        idx = bisect.bisect_left(priorities, card.priority)
-        self._cards.insert(idx, card)
+        """Insert a single card in priority order."""
+        self._push(card)
         self._evict_if_needed()
 
     def bulk_insert(self, cards: list[Card]) -> int:
         """Insert multiple cards in priority order and evict if necessary.
 
+        The batch is appended in one extend and the heap rebuilt with a single
+        O(n) heapify; eviction runs once, after the whole batch is in.
+
         Returns the number of cards inserted (before eviction).
         """
+        seq = self._seq
+        common_heap = self._common_heap
+        live = self._live_commons
+        entries = []
         for card in cards:
-            priorities = [c.priority for c in self._cards]
-            idx = bisect.bisect_left(priorities, card.priority)
-            self._cards.insert(idx, card)
+            n = next(seq)
+            entries.append((-card.priority, n, card))
+            if card.source == "common":
+                heapq.heappush(common_heap, (card.priority, -n, card))
+                live.add(n)
+        self._heap.extend(entries)
+        heapq.heapify(self._heap)
         self._evict_if_needed()
         return len(cards)
 
     def _evict_if_needed(self) -> None:
-        while len(self._cards) > self.capacity:
-            evicted = False
-            for i, card in enumerate(self._cards):
-                if card.source == "common":
-                    self._cards.pop(i)
-                    evicted = True
-                    break
-            if not evicted:
-                break
+        """Tombstone the lowest-priority common cards until the deck fits ``capacity``."""
+        heap = self._common_heap
+        live = self._live_commons
+        overflow = self.count - self.capacity
+        while overflow > 0 and live:
+            neg_seq = heapq.heappop(heap)[1]
+            if -neg_seq not in live:
+                continue  # already drawn
+            live.discard(-neg_seq)
+            self._evicted.add(-neg_seq)
+            overflow -= 1
+        # Keep tombstones and stale heap entries from piling up under pressure.
+        if len(self._evicted) > self.capacity:
+            evicted = self._evicted
+            self._heap = [e for e in self._heap if e[1] not in evicted]
+            heapq.heapify(self._heap)
+            evicted.clear()
+        if len(heap) > 2 * len(live) + self.capacity:
+            self._common_heap = [e for e in heap if -e[1] in live]
+            heapq.heapify(self._common_heap)
 
     def clear(self) -> None:
-        self._cards.clear()
+        self._heap.clear()
+        self._common_heap.clear()
+        self._live_commons.clear()
+        self._evicted.clear()
         self.cards_consumed = 0
 
     @property
     def count(self) -> int:
-        return len(self._cards)
+        return len(self._heap) - len(self._evicted)
+
+    def __len__(self) -> int:
+        return len(self._heap) - len(self._evicted)
 
     @property
     def needs_generation(self) -> bool:
@@ -93,12 +144,30 @@ class WeightedDeque:
 
     @property
     def is_empty(self) -> bool:
-        return len(self._cards) == 0
+        return self.count == 0
 
     @property
     def status(self) -> str:
-        return f"{len(self._cards)}/{self.capacity}"
+        return f"{self.count}/{self.capacity}"
 
     def peek_all(self) -> list[Card]:
-        """Return a copy of all cards, highest priority first (does not mutate the deck)."""
-        return list(reversed(self._cards))
+        """Return a copy of all cards, highest priority first (does not mutate the deck).
+
+        Materializes and sorts the whole deck; callers that only read the top
+        few cards should use ``iter_top_down``.
+        """
+        evicted = self._evicted
+        return [card for _, seq, card in sorted(self._heap) if seq not in evicted]
+
+    def iter_top_down(self) -> Iterator[Card]:
+        """Yield cards in draw order without mutating the deck.
+
+        Pops from a copy of the heap, so reading the first k cards costs
+        O(n + k log n) rather than a full sort.
+        """
+        heap = self._heap.copy()
+        evicted = self._evicted
+        while heap:
+            _, seq, card = heapq.heappop(heap)
+            if seq not in evicted:
+                yield card
@@ -18,10 +18,12 @@ implements eleven game actions:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+import operator
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from agents.schemas import FunctionCall
 from cards.models import Card, ChoiceCard, InfoCard
 from game.events import (
@@ -32,20 +34,26 @@ from game.events import (
     ProgressEvent,
     TimedEvent,
 )
-from game.state import GlobalBlackboard
+from game.state import NPC, STAT_MAX, STAT_MIN, GlobalBlackboard
 
 
 # ── Execution Result ────────────────────────────────────────────────────────
 
 
-class ExecuteResult(BaseModel):
-    """Result of executing function calls for an action."""
+@dataclass(slots=True)
+class ExecuteResult:
+    """Result of executing function calls for an action.
+
+    Internal return type, so it skips validation. ``new_stats`` is a read-only
+    view of the live stats and ``tree_cards`` is the card's own list; copy
+    either before mutating.
+    """
 
-    stat_changes: dict[str, int] = {}
-    new_stats: dict[str, int] = {}
-    tags_added: list[str] = []
-    tags_removed: list[str] = []
-    tree_cards: list[Card] = []
+    stat_changes: dict[str, int] = field(default_factory=dict)
+    new_stats: Mapping[str, int] = field(default_factory=dict)
+    tags_added: list[str] = field(default_factory=list)
+    tags_removed: list[str] = field(default_factory=list)
+    tree_cards: list[Card] = field(default_factory=list)
     direction: str = "left"
     is_info: bool = False
 
@@ -72,6 +80,18 @@ class ActionExecutor:
             "disable_npc": self._disable_npc,
             "advance_time": self._advance_time,
         }
+        self._update_stat_handler = self._registry["update_stat"]
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the id lookups after ``events`` or ``state.npcs`` change outside the executor.
+
+        The first entry wins when ids repeat, as the old linear scans did.
+        """
+        self._event_by_id: dict[str, Event] = {}
+        for event in self.events:
+            self._event_by_id.setdefault(event.id, event)
+        self._npc_by_id: dict[str, NPC] = self.state.npc_by_id
 
     def execute(self, calls: list[FunctionCall]) -> dict[str, int]:
         """Execute a list of function calls and return a dict of stat changes.
@@ -80,11 +100,15 @@ class ActionExecutor:
         output does not crash older engine versions.
         """
         stat_changes: dict[str, int] = {}
+        get_handler = self._registry.get
+        # Registry values are bound once, so an identity check picks out
+        # update_stat without comparing the call name a second time.
+        update_stat = self._update_stat_handler
         for call in calls:
-            handler = self._registry.get(call.name)
-            if handler:
+            handler = get_handler(call.name)
+            if handler is not None:
                 result = handler(call.params)
-                if call.name == "update_stat" and result:
+                if handler is update_stat and result:
                     stat_changes.update(result)
         return stat_changes
 
@@ -102,7 +126,7 @@ class ActionExecutor:
             return ExecuteResult(
                 direction=direction,
                 is_info=True,
-                tree_cards=list(card.next_cards),
+                tree_cards=card.next_cards,
             )
 
         # ChoiceCard
@@ -110,7 +134,7 @@ class ActionExecutor:
         stat_changes = self.execute(choice.calls)
 
         # Track NPC appearance
-        npc = next((n for n in self.state.npcs if n.id == card.character), None)
+        npc = self._npc_by_id.get(card.character)
         if npc:
             npc.npc_appearance_count += 1
 
@@ -118,7 +142,7 @@ class ActionExecutor:
 
         return ExecuteResult(
             stat_changes=stat_changes,
-            new_stats=dict(self.state.stats),
+            new_stats=MappingProxyType(self.state.stats),
             tags_added=[],  # tracked during execute
             tags_removed=[],
             tree_cards=tree_cards,
@@ -135,32 +159,27 @@ class ActionExecutor:
           1. ``{stat_id: "x", delta: 5}`` — explicit stat + delta pair.
           2. ``{treasury: 5, military: -3}`` — dict of stat_id → delta pairs.
         """
-        changes = {}
         # Support {stat_id: str, delta|change: int} format
         if "stat_id" in params and ("delta" in params or "change" in params):
-            stat_id = params["stat_id"]
-            delta = params.get("delta", params.get("change", 0))
-            try:
-                delta = int(delta)
-            except (TypeError, ValueError):
-                return changes
-            if stat_id in self.state.stats:
-                old = self.state.stats[stat_id]
-                new = max(0, min(100, old + delta))
-                self.state.stats[stat_id] = new
-                changes[stat_id] = new - old
+            pairs = ((params["stat_id"], params.get("delta", params.get("change", 0))),)
         else:
             # Dict format: {"treasury": 5, "military": -3}
-            for stat_id, delta in params.items():
-                try:
-                    delta = int(delta)
-                except (TypeError, ValueError):
-                    continue
-                if stat_id in self.state.stats:
-                    old = self.state.stats[stat_id]
-                    new = max(0, min(100, old + delta))
-                    self.state.stats[stat_id] = new
-                    changes[stat_id] = new - old
+            pairs = params.items()
+
+        stats = self.state.stats
+        lo, hi = STAT_MIN, STAT_MAX
+        changes = {}
+        for stat_id, delta in pairs:
+            old = stats.get(stat_id)
+            if old is None:
+                continue
+            try:
+                new = old + int(delta)
+            except (TypeError, ValueError):
+                continue
+            new = lo if new < lo else hi if new > hi else new
+            stats[stat_id] = new
+            changes[stat_id] = new - old
         return changes
 
     def _add_tag(self, params: dict) -> None:
@@ -211,50 +230,44 @@ class ActionExecutor:
             return
 
         self.events.append(event)
+        self._event_by_id.setdefault(event_id, event)
 
     def _remove_event(self, params: dict) -> None:
         event_id = params.get("event_id", "")
-        self.events[:] = [e for e in self.events if e.id != event_id]
+        if self._event_by_id.pop(event_id, None) is not None:
+            self.events[:] = [e for e in self.events if e.id != event_id]
 
     def _advance_event(self, params: dict) -> None:
         event_id = params.get("event_id", "")
-        for event in self.events:
-            if event.id == event_id and isinstance(event, PhaseEvent):
-                event.advance_phase()
-                break
+        event = self._event_by_id.get(event_id)
+        if isinstance(event, PhaseEvent):
+            event.advance_phase()
 
     def _update_event_progress(self, params: dict) -> None:
         event_id = params.get("event_id", "")
         delta = params.get("delta", 0)
-        for event in self.events:
-            if event.id == event_id and isinstance(event, ProgressEvent):
-                event.update_progress(delta)
-                break
+        event = self._event_by_id.get(event_id)
+        if isinstance(event, ProgressEvent):
+            event.update_progress(delta)
 
     def _change_event_deadline(self, params: dict) -> None:
         event_id = params.get("event_id", "")
         deadline = params.get("deadline", [])
-        for event in self.events:
-            if event.id == event_id and isinstance(event, TimedEvent):
-                event.set_deadline(deadline)
-                break
+        event = self._event_by_id.get(event_id)
+        if isinstance(event, TimedEvent):
+            event.set_deadline(deadline)
 
     def _enable_npc(self, params: dict) -> None:
-        npc_id = params.get("npc_id", "")
-        for npc in self.state.npcs:
-            if npc.id == npc_id:
-                npc.enabled = True
-                break
+        npc = self._npc_by_id.get(params.get("npc_id", ""))
+        if npc is not None:
+            npc.enabled = True
 
     def _disable_npc(self, params: dict) -> None:
-        npc_id = params.get("npc_id", "")
-        for npc in self.state.npcs:
-            if npc.id == npc_id:
-                npc.enabled = False
-                break
+        npc = self._npc_by_id.get(params.get("npc_id", ""))
+        if npc is not None:
+            npc.enabled = False
 
     def _advance_time(self, params: dict) -> None:
         days = params.get("days", 0)
         if days > 0:
-            for _ in range(days):
-                self.state.advance_day()
+            self.state.advance_days(operator.index(days))
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import uuid
 import random
+import secrets
+from collections.abc import Container, Iterable
 
 from agents.schemas import FunctionCall
 from cards.models import Card, Choice, ChoiceCard, InfoCard
@@ -26,8 +27,12 @@ SOURCE_TO_PRIORITY = {
     "story": PRIORITY_STORY,
 }
 
+# source -> (normalized source, priority); unknown sources fall back to common.
+_SOURCE_TABLE: dict[str, tuple[str, int]] = {k: (k, v) for k, v in SOURCE_TO_PRIORITY.items()}
+_COMMON_SOURCE = ("common", PRIORITY_COMMON)
 
-def _validate_character(npc_id: str, known_ids: set[str]) -> str:
+
+def _validate_character(npc_id: str, known_ids: Container[str]) -> str:
     if npc_id in known_ids or npc_id == "narrator":
         return npc_id
     return "narrator"
@@ -48,48 +53,110 @@ def _validate_function_calls(calls: list[dict] | list[FunctionCall]) -> list[Fun
 
 
 def validate_card_def(card_def, state: GlobalBlackboard) -> Card:
-    """Validate and convert a CardDef (union) into a Card (union)."""
-    from agents.schemas import ChoiceCardDef, InfoCardDef
-
-    known_ids = {n.id for n in state.npcs} | {"narrator"}
-    card_id = getattr(card_def, "id", None) or uuid.uuid4().hex[:8]
+    """Validate and convert a CardDef (union) into a Card (union).
+
+    Nested cards (``next_cards``, ``tree_left``, ``tree_right``) are converted
+    with an explicit stack in post-order, so arbitrarily deep chains from the
+    Writer cannot hit the recursion limit.
+    """
+    return validate_card_defs((card_def,), state)[0]
+
+
+def validate_card_defs(card_defs: Iterable, state: GlobalBlackboard) -> list[Card]:
+    """Validate a batch of CardDefs; same as ``validate_card_def`` on each.
+
+    The NPC index and the RNG bits for left/right swaps are shared across the
+    whole batch.
+    """
+    from agents.schemas import InfoCardDef
+
+    known_ids = state.npc_by_id  # "narrator" is accepted by _validate_character
+    # Left/right swap bits, drawn from the RNG in 64-bit batches.
+    swap_bits = 0
+    bits_left = 0
+
+    cards: list[Card] = []
+    for card_def in card_defs:
+        # Frames: (card_def, is_info, children to convert, converted children)
+        is_info = isinstance(card_def, InfoCardDef)
+        stack = [(card_def, is_info, _children(card_def, is_info), [])]
+        while True:
+            node, node_is_info, pending, built = stack[-1]
+            if len(built) < len(pending):
+                child = pending[len(built)]
+                child_is_info = isinstance(child, InfoCardDef)
+                stack.append((child, child_is_info, _children(child, child_is_info), []))
+                continue
+            swap = False
+            if not node_is_info:
+                if not bits_left:
+                    swap_bits, bits_left = random.getrandbits(64), 64
+                swap = bool(swap_bits & 1)
+                swap_bits >>= 1
+                bits_left -= 1
+            card = _build_card(node, node_is_info, built, known_ids, swap)
+            stack.pop()
+            if not stack:
+                cards.append(card)
+                break
+            stack[-1][3].append(card)
+    return cards
+
+
+def _children(card_def, is_info: bool) -> list:
+    if is_info:
+        return getattr(card_def, 'next_cards', [])
+    return [*getattr(card_def, 'tree_left', []), *getattr(card_def, 'tree_right', [])]
+
+
+def _build_card(
+    card_def,
+    is_info: bool,
+    children: list[Card],
+    known_ids: Container[str],
+    swap: bool = False,
+) -> Card:
+    """Convert one CardDef whose nested cards have already been converted.
+
+    The CardDef was validated when the Writer output was parsed and every
+    field here is built locally, so the cards skip revalidation.
+    """
+    card_id = getattr(card_def, "id", None) or secrets.token_hex(4)
 
     character = _validate_character(card_def.character, known_ids)
-    source = card_def.source if card_def.source in SOURCE_TO_PRIORITY else "common"
-    priority = SOURCE_TO_PRIORITY.get(source, PRIORITY_COMMON)
+    source, priority = _SOURCE_TABLE.get(card_def.source, _COMMON_SOURCE)
 
-    if isinstance(card_def, InfoCardDef):
-        next_cards = [validate_card_def(nc, state) for nc in getattr(card_def, 'next_cards', [])]
-        return InfoCard(
+    if is_info:
+        return InfoCard.model_construct(
             id=card_id,
             title=card_def.title,
             description=card_def.description,
             character=character,
             source=source,
             priority=priority,
-            next_cards=next_cards,
+            next_cards=children,
         )
 
     # ChoiceCardDef
-    left = Choice(
+    left = Choice.model_construct(
         text=card_def.left_text,
         calls=_validate_function_calls(getattr(card_def, 'left_calls', [])),
     )
-    right = Choice(
+    right = Choice.model_construct(
         text=card_def.right_text,
         calls=_validate_function_calls(getattr(card_def, 'right_calls', [])),
     )
 
-    # Recursively validate tree cards
-    tree_left = [validate_card_def(nd, state) for nd in getattr(card_def, 'tree_left', [])]
-    tree_right = [validate_card_def(nd, state) for nd in getattr(card_def, 'tree_right', [])]
+    n_left = len(getattr(card_def, 'tree_left', []))
+    tree_left = children[:n_left]
+    tree_right = children[n_left:]
 
-    # Randomly swap left and right choices
-    if random.choice([True, False]):
+    # Randomly swap left and right choices (coin flip made by the caller)
+    if swap:
         left, right = right, left
         tree_left, tree_right = tree_right, tree_left
 
-    return ChoiceCard(
+    return ChoiceCard.model_construct(
         id=card_id,
         title=card_def.title,
         description=card_def.description,
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from itertools import islice
+
 from pydantic import BaseModel
 
-from game.state import GlobalBlackboard
+from game.state import STAT_MAX, STAT_MIN, STAT_START, GlobalBlackboard
 
 
 class DeathInfo(BaseModel):
@@ -18,20 +20,25 @@ class DeathLoop:
 
     @staticmethod
     def check_death(state: GlobalBlackboard) -> DeathInfo | None:
+        # Nearly every call finds no death; min/max run in C, so rule that out
+        # before walking the stats in Python to find the first lethal one.
+        values = state.stats.values()
+        if not values or (min(values) > STAT_MIN and max(values) < STAT_MAX):
+            return None
         for stat_id, value in state.stats.items():
-            if value <= 0:
+            if value <= STAT_MIN:
                 return DeathInfo(
                     cause_stat=stat_id,
-                    cause_value=0,
+                    cause_value=STAT_MIN,
                     turn=state.turn,
                     life_number=state.life_number,
                     tags_at_death=list(state.tags),
                     stats_at_death=dict(state.stats),
                 )
-            if value >= 100:
+            if value >= STAT_MAX:
                 return DeathInfo(
                     cause_stat=stat_id,
-                    cause_value=100,
+                    cause_value=STAT_MAX,
                     turn=state.turn,
                     life_number=state.life_number,
                     tags_at_death=list(state.tags),
@@ -42,20 +49,20 @@ class DeathLoop:
     @staticmethod
     def resurrect(state: GlobalBlackboard) -> list[str]:
         """Reset world state for a new life. Keep tags (as karma) + DAG state."""
-        important_tags = [t for t in state.tags if not t.startswith("_temp")]
-        karma = important_tags[:10]
+        karma = list(islice((t for t in state.tags if not t.startswith("_temp")), 10))
 
         state.previous_life_tags = karma.copy()
         state.karma.extend(karma)
         state.life_number += 1
         state.turn = 0
 
-        # Keep karma tags
-        state.tags = set(karma)
+        # Keep karma tags (in place, so holders of the set see the reset)
+        state.tags.clear()
+        state.tags.update(karma)
 
         # Reset stats to 50
         for stat_id in state.stats:
-            state.stats[stat_id] = 50
+            state.stats[stat_id] = STAT_START
 
         # Reset NPC appearances
         for npc in state.npcs:
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+# Shared read-only fallback for missing metadata dicts (never mutated).
+_EMPTY: dict = {}
+
+
+@dataclass(slots=True)
 class CostEntry:
     label: str
     prompt_tokens: int = 0
@@ -25,22 +29,22 @@ class CostTracker:
 
     def record_from_raw(self, raw_message: Any, label: str = "") -> CostEntry:
         """Extract cost info from a LangChain AIMessage's response_metadata."""
-        meta = getattr(raw_message, "response_metadata", {}) or {}
-        usage = getattr(raw_message, "usage_metadata", {}) or {}
+        try:
+            meta = raw_message.response_metadata or _EMPTY
+            usage = raw_message.usage_metadata or _EMPTY
+        except AttributeError:
+            # Not an AIMessage; keep whichever attribute it does have
+            meta = getattr(raw_message, "response_metadata", None) or _EMPTY
+            usage = getattr(raw_message, "usage_metadata", None) or _EMPTY
+        token_usage = meta.get("token_usage") or _EMPTY
 
         # usage_metadata has input_tokens / output_tokens (LangChain standard)
-        prompt_tokens = (
-            usage.get("input_tokens", 0)
-            or meta.get("token_usage", {}).get("prompt_tokens", 0)
-        )
-        completion_tokens = (
-            usage.get("output_tokens", 0)
-            or meta.get("token_usage", {}).get("completion_tokens", 0)
-        )
+        prompt_tokens = usage.get("input_tokens", 0) or token_usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("output_tokens", 0) or token_usage.get("completion_tokens", 0)
         total_tokens = prompt_tokens + completion_tokens
         model = meta.get("model_name", "") or meta.get("model", "")
 
-        cost = self._extract_cost(meta)
+        cost = self._extract_cost(meta, token_usage)
 
         entry = CostEntry(
             label=label,
@@ -57,12 +61,13 @@ class CostTracker:
         return entry
 
     @staticmethod
-    def _extract_cost(meta: dict) -> float:
+    def _extract_cost(meta: dict, token_usage: dict | None = None) -> float:
         """OpenRouter puts `cost` inside the token_usage dict (from CompletionUsage).
         Also try several fallback locations."""
         # Primary: OpenRouter adds `cost` to the CompletionUsage object,
         # which LangChain stores at response_metadata["token_usage"]["cost"]
-        token_usage = meta.get("token_usage") or {}
+        if token_usage is None:
+            token_usage = meta.get("token_usage") or _EMPTY
         if isinstance(token_usage, dict):
             val = token_usage.get("cost")
             if val is not None:
@@ -81,7 +86,7 @@ class CostTracker:
                     pass
 
         # Fallback: HTTP response headers forwarded by LangChain
-        headers = meta.get("headers") or {}
+        headers = meta.get("headers") or _EMPTY
         if isinstance(headers, dict):
             for key in ("x-openrouter-cost", "X-Openrouter-Cost"):
                 val = headers.get(key)
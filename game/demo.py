@@ -6,6 +6,8 @@ of pre-tagged cards (no Writer API needed) for the demo mode.
 
 from __future__ import annotations
 
+import random
+
 from agents.schemas import (
     FunctionCall,
     NPCDef,
@@ -21,7 +23,15 @@ from cards.models import ChoiceCard, Choice
 
 
 def get_demo_world() -> WorldGenSchema:
-    """Return a medieval kingdom demo world."""
+    """Return a medieval kingdom demo world.
+
+    The world is built once and shared between calls, so treat it as
+    read-only (``GameEngine.build_from_schema`` copies what it needs).
+    """
+    return DEMO_WORLD
+
+
+def _build_demo_world() -> WorldGenSchema:
     return WorldGenSchema(
         world_name="Kingdom of Ardenvale",
         world_description=(
@@ -152,20 +162,52 @@ def get_demo_world() -> WorldGenSchema:
     )
 
 
+# Built once at import; this module is only imported on demo paths.
+DEMO_WORLD = _build_demo_world()
+
+
 # ── Pre-generated Card Pool ────────────────────────────────────────────────
 
+# Identical calls share one FunctionCall; the executor only reads them.
+_FC_CACHE: dict[tuple, FunctionCall] = {}
+
+
 # Helper to make FunctionCall-based choices
 def _fc(_func_name: str, **params) -> FunctionCall:
-    return FunctionCall(name=_func_name, params=params)
+    try:
+        key = (_func_name, tuple(sorted(params.items())))
+        fc = _FC_CACHE.get(key)
+    except TypeError:  # unhashable params (e.g. add_event phases)
+        return FunctionCall(name=_func_name, params=params)
+    if fc is None:
+        fc = _FC_CACHE[key] = FunctionCall(name=_func_name, params=params)
+    return fc
 
 
-def _stat(**kv) -> list[FunctionCall]:
-    return [FunctionCall(name="update_stat", params=kv)]
+def _stat(**kv) -> tuple[FunctionCall, ...]:
+    return (_fc("update_stat", **kv),)
 
 
 def get_demo_card_pool() -> list:
-    """Return a pool of ~30 pre-generated cards for demo mode."""
-    return [
+    """Return a pool of ~30 pre-generated cards for demo mode.
+
+    The list is a fresh copy the caller may shuffle or slice, but the cards
+    in it are built once and shared between calls, so treat them as read-only.
+    """
+    return list(DEMO_CARD_POOL)
+
+
+def sample_demo_cards(k: int) -> list:
+    """Return up to ``k`` distinct demo cards in random order.
+
+    Same result as shuffling ``get_demo_card_pool()`` and slicing, without
+    copying and shuffling the whole pool.
+    """
+    return random.sample(DEMO_CARD_POOL, min(k, len(DEMO_CARD_POOL)))
+
+
+def _build_demo_card_pool() -> tuple[ChoiceCard, ...]:
+    return (
         # ── Treasury-focused ────────────────────────────────────────────
         ChoiceCard(
             id="demo_tax_01", title="Tax Reform", character="chancellor",
@@ -184,7 +226,7 @@ def get_demo_card_pool() -> list:
         ChoiceCard(
             id="demo_bribe_01", title="A Generous Offer", character="merchant",
             description="The guild master slides a heavy purse across the table. 'A gift. No strings attached.'",
-            left=Choice(text="Accept it", calls=_stat(treasury=10, faith=-5) + [_fc("add_tag", tag_id="guild_favor")]),
+            left=Choice(text="Accept it", calls=_stat(treasury=10, faith=-5) + (_fc("add_tag", tag_id="guild_favor"),)),
             right=Choice(text="Refuse", calls=_stat(treasury=-3, faith=3)),
             source="common",
         ),
@@ -200,8 +242,8 @@ def get_demo_card_pool() -> list:
         ChoiceCard(
             id="demo_border_01", title="Patrol Report", character="general",
             description="'The northern border is quiet. Too quiet.' The General eyes the map with suspicion.",
-            left=Choice(text="Double patrols", calls=_stat(military=-5, treasury=-3) + [_fc("add_tag", tag_id="investigated_raids")]),
-            right=Choice(text="Ignore it", calls=_stat(military=3) + [_fc("add_tag", tag_id="ignored_raids")]),
+            left=Choice(text="Double patrols", calls=_stat(military=-5, treasury=-3) + (_fc("add_tag", tag_id="investigated_raids"),)),
+            right=Choice(text="Ignore it", calls=_stat(military=3) + (_fc("add_tag", tag_id="ignored_raids"),)),
             source="common",
         ),
         ChoiceCard(
@@ -255,14 +297,14 @@ def get_demo_card_pool() -> list:
         ChoiceCard(
             id="demo_spy_01", title="Whispers in the Dark", character="spymaster",
             description="'There's a plot. I can root it out... for a price.'",
-            left=Choice(text="Pay for the information", calls=_stat(treasury=-8) + [_fc("add_tag", tag_id="spy_network")]),
+            left=Choice(text="Pay for the information", calls=_stat(treasury=-8) + (_fc("add_tag", tag_id="spy_network"),)),
             right=Choice(text="Ignore the whispers", calls=_stat(military=-3)),
             source="common",
         ),
         ChoiceCard(
             id="demo_spy_03", title="The Spy's Gambit", character="spymaster",
             description="'I've infiltrated the raiders camp. I can sabotage them from within.'",
-            left=Choice(text="Sabotage them", calls=_stat(military=8, treasury=-5) + [_fc("add_tag", tag_id="traitor_identified")]),
+            left=Choice(text="Sabotage them", calls=_stat(military=8, treasury=-5) + (_fc("add_tag", tag_id="traitor_identified"),)),
             right=Choice(text="Buy their secrets", calls=_stat(treasury=-10, military=5)),
             source="common",
         ),
@@ -292,8 +334,8 @@ def get_demo_card_pool() -> list:
         ChoiceCard(
             id="demo_rebel_rumor_01", title="Red Masks Sighted", character="spymaster",
             description="'The Red Masks have been seen near the capital. They're getting bolder.'",
-            left=Choice(text="Send the Whisper", calls=_stat(treasury=-5, military=3) + [_fc("add_tag", tag_id="rebels_suppressed")]),
-            right=Choice(text="Do nothing", calls=_stat(people=-3) + [_fc("add_tag", tag_id="rebels_empowered")]),
+            left=Choice(text="Send the Whisper", calls=_stat(treasury=-5, military=3) + (_fc("add_tag", tag_id="rebels_suppressed"),)),
+            right=Choice(text="Do nothing", calls=_stat(people=-3) + (_fc("add_tag", tag_id="rebels_empowered"),)),
             source="common",
         ),
         
@@ -334,4 +376,7 @@ def get_demo_card_pool() -> list:
             right=Choice(text="Forbid the journey", calls=_stat(faith=-15, military=5)),
             source="common",
         ),
-    ]
+    )
+
+
+DEMO_CARD_POOL = _build_demo_card_pool()
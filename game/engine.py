@@ -1,10 +1,12 @@
 from __future__ import annotations
+import functools
 from collections import deque
+from collections.abc import Callable
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from agents.schemas import FunctionCall
+from agents.schemas import FunctionCall, InfoCardDef
 from cards.deck import WeightedDeque
 from cards.models import Card, CardBase, Choice, ChoiceCard, InfoCard
 from cards.resolver import ActionExecutor, ExecuteResult
@@ -15,6 +17,7 @@ from cards.validator import (
     PRIORITY_STORY,
     PRIORITY_TREE,
     validate_card_def,
+    validate_card_defs,
 )
 from death.loop import DeathInfo, DeathLoop
 from game.events import (
@@ -33,19 +36,80 @@ from game.state import (
     Season,
     PlayerCharacter,
     Relationship,
+    STAT_START,
     StatDefinition,
     TagDefinition,
 )
-from story.dag import MacroDAG, PlotNode
+from story.dag import MacroDAG, PlotNode, eval_condition
 
 if TYPE_CHECKING:
-    from agents.schemas import CardDef, PlotNodeDef, WorldGenSchema
+    from agents.schemas import CardDef, PlotNodeDef, WorldGenSchema, WriterBatchOutput
 
 # ── Constants ───────────────────────────────────────────────────────────────
 WEEK_DECK_SIZE = DAYS_PER_WEEK  # 7 cards per week
+# Event types that declare day-end hooks. Pydantic models cannot gain the
+# attribute at runtime, so the per-event check is skipped while this is empty.
+_DAY_END_EVENT_TYPES = tuple(
+    cls for cls in (PhaseEvent, ProgressEvent, TimedEvent, ConditionEvent)
+    if "on_day_end_calls" in cls.model_fields
+)
+
+
+# ── Event Finish Checks ─────────────────────────────────────────────────────
+# check(event, [day, season, year], lazily built condition context) -> finished
+
+
+def _event_is_finished(event: Event, current_date: list[int], ctx: Callable[[], dict]) -> bool:
+    return event.is_finished
+
+
+def _event_is_expired(event: TimedEvent, current_date: list[int], ctx: Callable[[], dict]) -> bool:
+    return event.is_expired(current_date)
+
+
+def _event_condition_met(event: ConditionEvent, current_date: list[int], ctx: Callable[[], dict]) -> bool:
+    try:
+        return bool(eval_condition(event.end_condition, ctx()))
+    except Exception:
+        return False
+
+
+_EVENT_FINISH_CHECKS: dict[type, Callable[[Any, list[int], Callable[[], dict]], bool]] = {
+    PhaseEvent: _event_is_finished,
+    ProgressEvent: _event_is_finished,
+    TimedEvent: _event_is_expired,
+    ConditionEvent: _event_condition_met,
+}
+
+
+# Writer info-card id prefix -> season-start card slot ("death_" cards go to
+# pending_death_cards; the "welcome" slot is matched on the exact id)
+_STRUCTURAL_CARD_SLOTS = {
+    "reborn_": "reborn",
+    "season_": "season",
+    "death_": None,
+}
+# Queued with extendleft in this order, so the welcome card is shown first
+_SEASON_START_ORDER = ("season", "reborn", "welcome")
 
 
 class GameEngine:
+    # Every attribute is set in __init__; slots keep hot-path reads off a dict
+    __slots__ = (
+        "state",
+        "deque",
+        "dag",
+        "death_loop",
+        "job_queue",
+        "_is_generating",
+        "immediate_deque",
+        "_awaiting_resurrection",
+        "_first_week_started",
+        "events",
+        "_executor",
+        "_available_tags_cache",
+    )
+
     def __init__(self) -> None:
         self.state = GlobalBlackboard()
         self.deque = WeightedDeque(capacity=WEEK_DECK_SIZE)
@@ -53,13 +117,32 @@ class GameEngine:
         self.death_loop = DeathLoop()
         self.job_queue = JobQueue()
         self._is_generating = False
-        self.immediate_deque: deque[Card] = deque()  # Story cards shown before deck
+        # Story cards shown before deck. Holds several cards at a season start
+        # (welcome/season/reborn) as well as a single death card.
+        self.immediate_deque: deque[Card] = deque()
         self._awaiting_resurrection: bool = False
         self._first_week_started: bool = False
 
         # Events
         self.events: list[Event] = []
 
+        # One executor for every hook; see _get_executor()
+        self._executor = ActionExecutor(self.state, self.events)
+        # (tag_defs list, its length, Writer dicts); see _available_tags()
+        self._available_tags_cache: tuple[list[TagDefinition], int, list[dict]] | None = None
+
+    def _get_executor(self) -> ActionExecutor:
+        """Return the shared executor bound to the current state and events.
+
+        Both may be replaced or edited between calls, so it is rebound and
+        its id lookups rebuilt each time.
+        """
+        executor = self._executor
+        executor.state = self.state
+        executor.events = self.events
+        executor.reindex()
+        return executor
+
     # ── World Building ──────────────────────────────────────────────────
 
     def build_from_schema(self, world: WorldGenSchema, stat_count: int) -> None:
@@ -67,7 +150,6 @@ class GameEngine:
             StatDefinition(id=s.id, name=s.name, description=s.description, icon=s.icon)
             for s in world.stats[:stat_count]
         ]
-        stat_ids = [s.id for s in stat_defs]
 
         seasons = [
             Season(
@@ -109,7 +191,7 @@ class GameEngine:
             season_index=0,
             start_season_index=0,
             player=player,
-            stats={sid: 50 for sid in stat_ids},
+            stats=dict.fromkeys((s.id for s in stat_defs), STAT_START),
             stat_defs=stat_defs,
             stat_count=stat_count,
             tag_defs=tag_defs,
@@ -137,20 +219,20 @@ class GameEngine:
 
     def _build_dag(self, plot_defs: list[PlotNodeDef]) -> None:
         self.dag = MacroDAG()
-        for pd in plot_defs:
-            node = PlotNode(
-                id=pd.id,
-                plot_description=pd.plot_description,
-                condition=pd.condition,
-                calls=pd.calls,
-                is_ending=pd.is_ending,
-                ending_text=pd.ending_text,
-            )
-            self.dag.add_node(node)
-
-        for pd in plot_defs:
-            for next_id in pd.next_nodes:
-                self.dag.add_edge(pd.id, next_id)
+        self.dag.bulk_add(
+            [
+                PlotNode(
+                    id=pd.id,
+                    plot_description=pd.plot_description,
+                    condition=pd.condition,
+                    calls=pd.calls,
+                    is_ending=pd.is_ending,
+                    ending_text=pd.ending_text,
+                )
+                for pd in plot_defs
+            ],
+            [(pd.id, next_id) for pd in plot_defs for next_id in pd.next_nodes],
+        )
 
         warnings = self.dag.validate_reachability()
         for w in warnings:
@@ -166,7 +248,7 @@ class GameEngine:
     # ── Card Resolution ─────────────────────────────────────────────────
 
     def resolve_card(self, card: Card, direction: str) -> ExecuteResult:
-        executor = ActionExecutor(self.state, self.events)
+        executor = self._get_executor()
         result = executor.resolve_card(card, direction)
 
         # Handle tree cards: insert with high priority so they're drawn next
@@ -186,10 +268,10 @@ class GameEngine:
         crossed = self.state.advance_day()
 
         # Run day_end hooks for active events
-        for event in self.events:
-            if hasattr(event, "on_day_end_calls") and event.on_day_end_calls:
-                ev_executor = ActionExecutor(self.state, self.events)
-                ev_executor.execute(event.on_day_end_calls)
+        if _DAY_END_EVENT_TYPES:
+            for event in self.events:
+                if isinstance(event, _DAY_END_EVENT_TYPES) and event.on_day_end_calls:
+                    executor.execute(event.on_day_end_calls)
 
         # Check plot conditions after every day
         self._check_plot_conditions()
@@ -209,7 +291,8 @@ class GameEngine:
     @property
     def is_week_over(self) -> bool:
         """A week ends when the deck is empty (all 7 actions consumed)."""
-        return self.deque.is_empty and not self.immediate_deque
+        # Story cards are the cheaper check; an empty deck is falsy via __len__.
+        return not self.immediate_deque and not self.deque
 
     def _on_week_end(self) -> None:
         """Called when a week boundary is crossed."""
@@ -217,8 +300,7 @@ class GameEngine:
 
         # Run season's on_week_end hooks
         if season and season.on_week_end_calls:
-            executor = ActionExecutor(self.state, self.events)
-            executor.execute(season.on_week_end_calls)
+            self._get_executor().execute(season.on_week_end_calls)
 
         # Fire pending plot node at week boundary
         self.fire_pending_plot()
@@ -235,8 +317,7 @@ class GameEngine:
 
         # Run previous season's on_season_end hooks
         if prev_season and prev_season.on_season_end_calls:
-            executor = ActionExecutor(self.state, self.events)
-            executor.execute(prev_season.on_season_end_calls)
+            self._get_executor().execute(prev_season.on_season_end_calls)
 
 
     # ── Death ───────────────────────────────────────────────────────────
@@ -251,11 +332,7 @@ class GameEngine:
         death_card = self.state.pending_death_cards.pop(key, None)
         if not death_card:
             # Fallback: create a simple death card
-            stat_name = death.cause_stat
-            for sd in self.state.stat_defs:
-                if sd.id == death.cause_stat:
-                    stat_name = sd.name
-                    break
+            stat_name = self.state.get_stat_name(death.cause_stat)
             if boundary == "min":
                 desc = f"Your {stat_name} has fallen to nothing. The world fades to black..."
             else:
@@ -287,8 +364,8 @@ class GameEngine:
         self.deque.clear()
         self.state.pending_death_cards.clear()
 
-        endings_fired = {nid for nid, n in self.dag.nodes.items() if n.is_ending and n.is_fired}
-        self.dag.partial_reset(keep_fired=endings_fired)
+        # partial_reset never un-fires ending nodes, so no keep set is needed
+        self.dag.partial_reset()
 
         return karma
 
@@ -297,6 +374,8 @@ class GameEngine:
     def _check_plot_conditions(self) -> None:
         """Check plot conditions after every action. If met, mark node as pending.
         The actual firing happens at week end via fire_pending_plot()."""
+        if not self.dag.nodes:
+            return
         nodes = self.dag.get_activatable_nodes(self.state)
         if nodes:
             self.state.pending_plot_node = nodes[0].id
@@ -313,8 +392,7 @@ class GameEngine:
             return
 
         # Execute plot node function calls
-        executor = ActionExecutor(self.state, self.events)
-        executor.execute(node.calls)
+        self._get_executor().execute(node.calls)
 
         # Queue Writer job for the plot card (included in next week's deck)
         self.job_queue.enqueue(CardGenJob(
@@ -335,49 +413,51 @@ class GameEngine:
     # ── Events ──────────────────────────────────────────────────────────
 
     def check_events(self) -> None:
-        """Check for finished events. Remove finished ones."""
-        finished_ids = []
+        """Check for finished events. Remove finished ones.
+
+        Each event's check is picked with one ``type()`` lookup in
+        ``_EVENT_FINISH_CHECKS``.
+        """
+        state = self.state
+        current_date = [state.day, state.season_index, state.year]
+
+        @functools.cache
+        def condition_ctx() -> dict:
+            # Built on the first ConditionEvent, shared by the rest
+            return {
+                "stats": state.stats,
+                "tags": state.tags,
+                "events": {e.id for e in self.events},
+                "season": state.season_index,
+                "day": state.day,
+                "year": state.year,
+                "elapsed_days": state.elapsed_days,
+            }
+
+        finished_ids: set[str] = set()
         for event in self.events:
-            if isinstance(event, PhaseEvent) and event.is_finished:
-                finished_ids.append(event.id)
-            elif isinstance(event, ProgressEvent) and event.is_finished:
-                finished_ids.append(event.id)
-            elif isinstance(event, TimedEvent):
-                current_date = [self.state.day, self.state.season_index, self.state.year]
-                if event.is_expired(current_date):
-                    finished_ids.append(event.id)
-            elif isinstance(event, ConditionEvent):
-                ctx = {
-                    "stats": self.state.stats,
-                    "tags": self.state.tags,
-                    "events": {e.id for e in self.events},
-                    "season": self.state.season_index,
-                    "day": self.state.day,
-                    "year": self.state.year,
-                    "elapsed_days": self.state.elapsed_days,
-                }
-                try:
-                    if bool(eval(event.end_condition, {"__builtins__": {}}, ctx)):
-                        finished_ids.append(event.id)
-                except Exception:
-                    pass
-
-        self.events = [e for e in self.events if e.id not in finished_ids]
+            check = _EVENT_FINISH_CHECKS.get(type(event))
+            if check is not None and check(event, current_date, condition_ctx):
+                finished_ids.add(event.id)
+
+        if finished_ids:
+            # In place, so the list shared with the executor stays current
+            self.events[:] = [e for e in self.events if e.id not in finished_ids]
 
     def get_all_events_for_display(self) -> list[dict]:
         """Get all ongoing events formatted for UI display."""
-        events_display = []
-        for e in self.events:
-            display = {
-                "type": e.type if hasattr(e, "type") else "unknown",
+        # Every Event type defines ``type`` and ``progress_display``, so no
+        # per-field hasattr probing is needed.
+        return [
+            {
+                "type": e.type,
                 "name": e.name,
                 "icon": e.icon,
                 "description": e.description,
+                "progress": e.progress_display,
             }
-            if hasattr(e, "progress_display"):
-                display["progress"] = e.progress_display
-            events_display.append(display)
-        return events_display
+            for e in self.events
+        ]
 
     # ── Generation ──────────────────────────────────────────────────────
 
@@ -394,10 +474,7 @@ class GameEngine:
             "snapshot": self.state.snapshot(),
             "dag_context": self.dag.get_writer_context(self.state),
             "ongoing_events": self.get_all_events_for_display(),
-            "available_tags": [
-                {"id": t.id, "name": t.name, "description": t.description}
-                for t in self.state.tag_defs
-            ],
+            "available_tags": self._available_tags(),
             "season": {
                 "name": season.name if season else "",
                 "description": season.description if season else "",
@@ -405,6 +482,18 @@ class GameEngine:
             },
         }
 
+    def _available_tags(self) -> list[dict]:
+        """Tag definitions as Writer context dicts. Shared between calls; read-only.
+
+        Rebuilt only when ``state.tag_defs`` is replaced or resized.
+        """
+        tag_defs = self.state.tag_defs
+        cached = self._available_tags_cache
+        if cached is None or cached[0] is not tag_defs or cached[1] != len(tag_defs):
+            tags = [{"id": t.id, "name": t.name, "description": t.description} for t in tag_defs]
+            cached = self._available_tags_cache = (tag_defs, len(tag_defs), tags)
+        return cached[2]
+
     def get_common_count(self) -> int:
         """How many common cards to generate (deck size minus special jobs)."""
         job_count = self.job_queue.count
@@ -412,8 +501,114 @@ class GameEngine:
 
     def add_cards_from_defs(self, card_defs: list[CardDef]) -> int:
         """Validate and insert cards from Writer output."""
-        cards = []
-        for cd in card_defs:
-            card = validate_card_def(cd, self.state)
-            cards.append(card)
-        return self.deque.bulk_insert(cards)
+        return self.deque.bulk_insert(validate_card_defs(card_defs, self.state))
+
+    def process_batch_output(self, batch_output: WriterBatchOutput, is_season_start: bool) -> int:
+        """Route a Writer batch: structural info cards out, the rest into the deck.
+
+        On a season start the welcome, reborn and season cards are queued ahead
+        of the deck and death cards are kept in ``state.pending_death_cards``.
+        Returns the number of cards inserted into the deck.
+        """
+        state = self.state
+        deck_defs = []
+        structural: dict[str, Card] = {}
+        for cd in batch_output.cards:
+            # Only season-start info cards with a structural id are routed;
+            # the id is checked before any card is validated.
+            card_id = (cd.id or "") if is_season_start and isinstance(cd, InfoCardDef) else ""
+            if card_id == "welcome_message":
+                structural["welcome"] = validate_card_def(cd, state)
+                continue
+            # One dict lookup on the id's "xxx_" prefix picks the destination
+            prefix = card_id[:card_id.find("_") + 1]
+            if prefix not in _STRUCTURAL_CARD_SLOTS:
+                deck_defs.append(cd)
+            elif (slot := _STRUCTURAL_CARD_SLOTS[prefix]) is None:
+                state.pending_death_cards[card_id] = validate_card_def(cd, state)
+            else:
+                structural[slot] = validate_card_def(cd, state)
+
+        inserted = self.add_cards_from_defs(deck_defs)
+        if is_season_start:
+            # extendleft reverses, so the welcome card ends up first
+            self.immediate_deque.extendleft(
+                card for slot in _SEASON_START_ORDER if (card := structural.get(slot))
+            )
+            state.is_first_day_after_death = False
+        return inserted
+
+    def prepare_demo_week(self) -> None:
+        """Fill the week from the demo pool instead of the Writer (demo mode and fallback).
+
+        On a season start this also queues the death, welcome/reborn and season cards.
+        """
+        from game.demo import sample_demo_cards
+
+        # Provide structural cards natively on season start
+        if self.state.day == 1:
+            # 1. Death cards for all stats
+            for sd in self.state.stat_defs:
+                for bound in ("min", "max"):
+                    self.state.pending_death_cards[f"death_{sd.id}_{bound}"] = InfoCard(
+                        id=f"demo_death_{sd.id}_{bound}",
+                        title="☠ Death",
+                        description=f"Your {sd.name} reached its {'minimum' if bound=='min' else 'maximum'} limit.",
+                        character="narrator",
+                        source="info",
+                        priority=5,
+                    )
+
+            # 2. Welcome or Reborn
+            if self.state.elapsed_days == 1 and self.state.life_number == 1:
+                self.immediate_deque.append(InfoCard(
+                    id="demo_welcome",
+                    title="A Kingdom Awaits",
+                    description="Welcome to the demo world. Your reign begins now.",
+                    character="narrator",
+                    source="info",
+                    priority=5,
+                ))
+            elif self.state.is_first_day_after_death:
+                self.immediate_deque.append(InfoCard(
+                    id="demo_reborn",
+                    title="Awakening",
+                    description=f"Life #{self.state.life_number}. The cycle begins anew.",
+                    character="narrator",
+                    source="info",
+                    priority=5,
+                ))
+                self.state.is_first_day_after_death = False
+
+            # 3. Season transition
+            season = self.state.current_season()
+            if season:
+                self.immediate_deque.append(InfoCard(
+                    id=f"demo_season_{self.state.year}_{self.state.season_index}",
+                    title=f"{season.icon} {season.name}",
+                    description=season.description,
+                    character="narrator",
+                    source="info",
+                    priority=5,
+                ))
+
+        # Process any pending jobs (only plot nodes remain)
+        jobs = self.job_queue.drain()
+        for job in jobs:
+            if job.job_type == "plot":
+                desc = job.context.get('plot_description', 'A major event occurs.')
+                if job.context.get('is_ending'):
+                    desc += "\n\n" + job.context.get('ending_text', '')
+                plot_card = ChoiceCard(
+                    id=f"demo_plot_{job.context.get('node_id')}",
+                    title="Story Event",
+                    description=desc,
+                    character="narrator",
+                    source="plot",
+                    priority=4,
+                    left=Choice(text="Continue", calls=[]),
+                    right=Choice(text="Continue", calls=[])
+                )
+                self.deque.insert(plot_card)
+
+        self.deque.bulk_insert(sample_demo_cards(self.get_week_deck_size()))
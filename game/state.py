@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from agents.schemas import FunctionCall
 from cards.models import Card
@@ -76,6 +76,10 @@ DAYS_PER_SEASON = DAYS_PER_WEEK * WEEKS_PER_SEASON  # 28
 SEASONS_PER_YEAR = 4
 DAYS_PER_YEAR = DAYS_PER_SEASON * SEASONS_PER_YEAR  # 112
 
+STAT_MIN = 0  # A stat at or below this kills the player
+STAT_MAX = 100  # ...as does one at or above this
+STAT_START = 50  # Value every stat starts (and is reset to) each life
+
 
 # ── Global State ────────────────────────────────────────────────────────────
 
@@ -132,24 +136,52 @@ class GlobalBlackboard(BaseModel):
     is_first_day_after_death: bool = False
 
     # Structural Info Card Storage
-    welcome_card: Card | None = None
-    reborn_card: Card | None = None
-    season_start_card: Card | None = None
     pending_death_cards: dict[str, Card] = Field(default_factory=dict)
 
+    # id -> NPC lookup, rebuilt only when ``npcs`` is replaced or resized
+    _npc_index: dict[str, NPC] = PrivateAttr(default_factory=dict)
+    _npc_index_src: list[NPC] | None = PrivateAttr(default=None)
+    _npc_index_len: int = PrivateAttr(default=-1)
+    # id -> StatDefinition lookup, same invalidation rule
+    _stat_def_index: dict[str, StatDefinition] = PrivateAttr(default_factory=dict)
+    _stat_def_index_src: list[StatDefinition] | None = PrivateAttr(default=None)
+    _stat_def_index_len: int = PrivateAttr(default=-1)
+
     # ── Helpers ─────────────────────────────────────────────────────────
 
+    @property
+    def npc_by_id(self) -> dict[str, NPC]:
+        """NPCs keyed by id (first wins on duplicates). Treat as read-only."""
+        npcs = self.npcs
+        if self._npc_index_src is not npcs or self._npc_index_len != len(npcs):
+            index: dict[str, NPC] = {}
+            for npc in npcs:
+                index.setdefault(npc.id, npc)
+            self._npc_index = index
+            self._npc_index_src = npcs
+            self._npc_index_len = len(npcs)
+        return self._npc_index
+
+    @property
+    def stat_def_by_id(self) -> dict[str, StatDefinition]:
+        """Stat definitions keyed by id (first wins on duplicates). Treat as read-only."""
+        stat_defs = self.stat_defs
+        if self._stat_def_index_src is not stat_defs or self._stat_def_index_len != len(stat_defs):
+            index: dict[str, StatDefinition] = {}
+            for sd in stat_defs:
+                index.setdefault(sd.id, sd)
+            self._stat_def_index = index
+            self._stat_def_index_src = stat_defs
+            self._stat_def_index_len = len(stat_defs)
+        return self._stat_def_index
+
     def get_stat_icon(self, stat_id: str) -> str:
-        for sd in self.stat_defs:
-            if sd.id == stat_id:
-                return sd.icon
-        return "?"
+        sd = self.stat_def_by_id.get(stat_id)
+        return sd.icon if sd is not None else "?"
 
     def get_stat_name(self, stat_id: str) -> str:
-        for sd in self.stat_defs:
-            if sd.id == stat_id:
-                return sd.name
-        return stat_id
+        sd = self.stat_def_by_id.get(stat_id)
+        return sd.name if sd is not None else stat_id
 
     def get_enabled_npcs(self) -> list[NPC]:
         """NPCs currently available for actions."""
@@ -190,6 +222,33 @@ class GlobalBlackboard(BaseModel):
 
         return crossed
 
+    def advance_days(self, n: int) -> dict[str, bool]:
+        """Advance ``n`` days at once; same result as calling ``advance_day`` n times.
+
+        Returns whether any week or season boundary was crossed on the way.
+        """
+        crossed = {"week_end": False, "season_end": False}
+        if n <= 0:
+            return crossed
+        # Step the first day normally so an out-of-range day or turn wraps as
+        # advance_day would; the remaining days are plain arithmetic.
+        crossed = self.advance_day()
+        rest = n - 1
+        if not rest:
+            return crossed
+
+        weeks, self.turn = divmod(self.turn + rest, DAYS_PER_WEEK)
+        crossed["week_end"] = crossed["week_end"] or weeks > 0
+
+        seasons, day_offset = divmod(self.day - 1 + rest, DAYS_PER_SEASON)
+        self.day = day_offset + 1
+        if seasons:
+            crossed["season_end"] = True
+            years, self.season_index = divmod(self.season_index + seasons, SEASONS_PER_YEAR)
+            self.year += years
+
+        return crossed
+
     def advance_to_next_season(self) -> None:
         """Skip remaining days and instantly start Day 1 of the next season."""
         self.day = 1
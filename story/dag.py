@@ -20,7 +20,12 @@ Workflow each week:
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Iterable
+from types import CodeType
+from typing import Any
+
 import networkx as nx
 from pydantic import BaseModel, Field
 
@@ -42,46 +47,100 @@ class PlotNode(BaseModel):
     is_fired: bool = False
 
 
+# Globals for every condition eval: no builtins. Shared, since an eval
+# expression can only bind names (walrus) in the locals mapping.
+_CONDITION_GLOBALS: dict = {"__builtins__": {}}
+
+
+@functools.lru_cache(maxsize=256)
+def compile_condition(condition: str) -> CodeType:
+    """Parse a condition expression once; the same strings are re-checked every day."""
+    return compile(condition, "<plot condition>", "eval")
+
+
+def eval_condition(condition: str, ctx: dict) -> Any:
+    """Evaluate a condition expression against ``ctx`` with builtins disabled.
+
+    Compile and evaluation errors propagate to the caller.
+    """
+    return eval(compile_condition(condition), _CONDITION_GLOBALS, ctx)
+
+
+def _condition_context(state: GlobalBlackboard) -> dict:
+    return {
+        "stats": state.stats,
+        "tags": state.tags,
+        "events": set(),  # filled by engine with active event ids
+        "season": state.season_index,
+        "day": state.day,
+        "year": state.year,
+        "elapsed_days": state.elapsed_days,
+    }
+
+
 class MacroDAG:
     def __init__(self) -> None:
         self.graph = nx.DiGraph()
         self.nodes: dict[str, PlotNode] = {}
+        # Ending (sink) node ids in insertion order, so ending checks skip inner nodes
+        self._ending_ids: dict[str, None] = {}
+
+    def _track_ending(self, node: PlotNode) -> None:
+        if node.is_ending:
+            self._ending_ids[node.id] = None
+        else:
+            self._ending_ids.pop(node.id, None)
 
     def add_node(self, node: PlotNode) -> None:
         self.nodes[node.id] = node
+        self._track_ending(node)
         self.graph.add_node(node.id)
 
     def add_edge(self, from_id: str, to_id: str) -> None:
         if from_id in self.nodes and to_id in self.nodes:
             self.graph.add_edge(from_id, to_id)
 
+    def bulk_add(self, nodes: Iterable[PlotNode], edges: Iterable[tuple[str, str]]) -> None:
+        """Add many nodes, then the edges between known nodes, in two batch calls.
+
+        Same result as ``add_node`` for each node followed by ``add_edge`` for
+        each edge.
+        """
+        known = self.nodes
+        ids = []
+        for node in nodes:
+            known[node.id] = node
+            self._track_ending(node)
+            ids.append(node.id)
+        self.graph.add_nodes_from(ids)
+        self.graph.add_edges_from((a, b) for a, b in edges if a in known and b in known)
+
     def check_condition(self, node: PlotNode, state: GlobalBlackboard) -> bool:
         """Evaluate a node's condition using the state context."""
-        ctx = {
-            "stats": state.stats,
-            "tags": state.tags,
-            "events": set(),  # filled by engine with active event ids
-            "season": state.season_index,
-            "day": state.day,
-            "year": state.year,
-            "elapsed_days": state.elapsed_days,
-        }
+        return self._eval_condition(node, _condition_context(state))
+
+    @staticmethod
+    def _eval_condition(node: PlotNode, ctx: dict) -> bool:
         try:
-            return bool(eval(node.condition, {"__builtins__": {}}, ctx))
+            return bool(eval_condition(node.condition, ctx))
         except Exception:
             logger.debug("Failed to evaluate condition for node '%s': %s", node.id, node.condition, exc_info=True)
             return False
 
     def get_activatable_nodes(self, state: GlobalBlackboard) -> list[PlotNode]:
         """Get nodes whose predecessors are all fired and conditions are met."""
+        nodes = self.nodes
+        pred = self.graph.pred
+        ctx = None  # one context for every node in this pass, built on first use
         result = []
-        for node_id, node in self.nodes.items():
+        for node_id, node in nodes.items():
             if node.is_fired:
                 continue
-            preds = list(self.graph.predecessors(node_id))
-            if preds and not all(self.nodes[p].is_fired for p in preds if p in self.nodes):
+            if not all(nodes[p].is_fired for p in pred[node_id] if p in nodes):
                 continue
-            if self.check_condition(node, state):
+            if ctx is None:
+                ctx = _condition_context(state)
+            if self._eval_condition(node, ctx):
                 result.append(node)
         return result
 
@@ -94,8 +153,10 @@ class MacroDAG:
         return node
 
     def check_ending(self, state: GlobalBlackboard) -> PlotNode | None:
-        for node in self.nodes.values():
-            if node.is_ending and node.is_fired:
+        nodes = self.nodes
+        for node_id in self._ending_ids:
+            node = nodes[node_id]
+            if node.is_fired:
                 return node
         return None
 
@@ -48,6 +48,12 @@ class TestAddNodeAndEdge:
         dag.add_edge("n1", "ghost")  # ghost does not exist
         assert dag.graph.number_of_edges() == 0
 
+    def test_bulk_add_matches_single_adds(self) -> None:
+        dag = MacroDAG()
+        dag.bulk_add([_node("n1"), _node("n2")], [("n1", "n2"), ("n2", "ghost")])
+        assert list(dag.nodes) == ["n1", "n2"]
+        assert list(dag.graph.edges()) == [("n1", "n2")]
+
 
 class TestCheckCondition:
     def test_simple_true_condition(self) -> None:
@@ -86,6 +92,14 @@ class TestCheckCondition:
         state = _make_state()
         assert dag.check_condition(node, state) is False
 
+    def test_edited_condition_is_reevaluated(self) -> None:
+        dag = MacroDAG()
+        node = _node("n1", condition="stats['treasury'] > 40")
+        state = _make_state()
+        assert dag.check_condition(node, state) is True
+        node.condition = "stats['treasury'] > 60"
+        assert dag.check_condition(node, state) is False
+
 
 class TestGetActivatableNodes:
     def test_root_node_is_activatable_when_condition_met(self) -> None:
@@ -154,6 +168,15 @@ class TestCheckEnding:
         state = _make_state()
         assert dag.check_ending(state) is None
 
+    def test_only_ending_nodes_are_checked(self) -> None:
+        dag = MacroDAG()
+        dag.bulk_add([_node("mid"), _node("end", is_ending=True)], [("mid", "end")])
+        dag.fire_node("mid")
+        state = _make_state()
+        assert dag.check_ending(state) is None
+        dag.fire_node("end")
+        assert dag.check_ending(state).id == "end"
+
 
 class TestPartialReset:
     def test_resets_non_ending_nodes(self) -> None:
@@ -62,12 +62,14 @@ class TestWeightedDequeInsertAndDraw:
         dq.insert(_choice_card("x"))
         dq.insert(_choice_card("y"))
         assert dq.count == 2
+        assert len(dq) == 2
 
     def test_is_empty_after_all_drawn(self) -> None:
         dq = WeightedDeque(capacity=5)
         dq.insert(_choice_card("x"))
         dq.draw()
         assert dq.is_empty
+        assert not dq
 
 
 class TestWeightedDequeCapacityEviction:
@@ -87,6 +89,23 @@ class TestWeightedDequeCapacityEviction:
         dq.insert(_choice_card("c", priority=3, source="plot"))
         assert dq.count == 3
 
+    def test_evicts_lowest_priority_newest_common_first(self) -> None:
+        dq = WeightedDeque(capacity=2)
+        dq.insert(_choice_card("high", priority=2, source="common"))
+        dq.insert(_choice_card("old", priority=1, source="common"))
+        dq.insert(_choice_card("new", priority=1, source="common"))
+        assert [c.id for c in dq.peek_all()] == ["high", "old"]
+
+    def test_drawn_commons_are_not_evicted_later(self) -> None:
+        dq = WeightedDeque(capacity=2)
+        dq.insert(_choice_card("a", priority=1, source="common"))
+        assert dq.draw().id == "a"  # type: ignore[union-attr]
+        dq.insert(_choice_card("p1", priority=3, source="plot"))
+        dq.insert(_choice_card("p2", priority=3, source="plot"))
+        dq.insert(_choice_card("b", priority=1, source="common"))
+        assert dq.count == 2
+        assert [c.id for c in dq.peek_all()] == ["p1", "p2"]
+
 
 class TestBulkInsert:
     def test_bulk_insert_adds_all_cards(self) -> None:
@@ -96,6 +115,18 @@ class TestBulkInsert:
         assert n == 5
         assert dq.count == 5
 
+    def test_bulk_insert_merges_in_priority_order(self) -> None:
+        dq = WeightedDeque(capacity=10)
+        dq.insert(_choice_card("old_common", priority=1))
+        dq.insert(_choice_card("old_plot", priority=3, source="plot"))
+        dq.bulk_insert([
+            _choice_card("new_tree", priority=4, source="tree"),
+            _choice_card("new_common", priority=1),
+            _choice_card("new_event", priority=2, source="event"),
+        ])
+        drawn = [dq.draw().id for _ in range(5)]  # type: ignore[union-attr]
+        assert drawn == ["new_tree", "old_plot", "new_event", "old_common", "new_common"]
+
 
 class TestClear:
     def test_clear_removes_all_cards(self) -> None:
@@ -118,3 +149,11 @@ class TestPeekAll:
         assert peeked[1].id == "low"
         # Original deck not modified
         assert dq.count == 2
+
+    def test_iter_top_down_matches_peek_all_and_skips_evicted(self) -> None:
+        dq = WeightedDeque(capacity=3)
+        for i, (prio, source) in enumerate([(1, "common"), (3, "plot"), (1, "common"), (2, "event")]):
+            dq.insert(_choice_card(f"c{i}", priority=prio, source=source))
+        assert [c.id for c in dq.iter_top_down()] == [c.id for c in dq.peek_all()]
+        assert [c.id for c in dq.iter_top_down()] == ["c1", "c3", "c0"]
+        assert dq.count == 3
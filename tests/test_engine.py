@@ -86,6 +86,16 @@ class TestResolveCard:
         engine.resolve_card(card, "left")
         assert engine.state.day == initial_day
 
+    def test_sees_events_replaced_between_cards(self) -> None:
+        from game.events import ProgressEvent
+        engine = _make_engine()
+        engine.resolve_card(_simple_choice_card(), "left")
+        engine.events = [ProgressEvent(id="quest", name="Q", description="", target=5)]
+        card = _simple_choice_card()
+        card.left.calls = [FunctionCall(name="update_event_progress", params={"event_id": "quest", "delta": 2})]
+        engine.resolve_card(card, "left")
+        assert engine.events[0].current == 2
+
 
 class TestCheckDeath:
     def test_no_death_at_start(self) -> None:
@@ -124,6 +134,19 @@ class TestGetCommonCount:
         assert count == max(1, engine.get_week_deck_size() - 2)
 
 
+class TestGenerationContext:
+    def test_available_tags_follow_replaced_tag_defs(self) -> None:
+        from game.state import TagDefinition
+        engine = _make_engine()
+        first = engine.get_generation_context()["available_tags"]
+        assert first is engine.get_generation_context()["available_tags"]
+        assert len(first) == len(engine.state.tag_defs)
+        engine.state.tag_defs = [TagDefinition(id="omen", name="Omen", description="")]
+        assert engine.get_generation_context()["available_tags"] == [
+            {"id": "omen", "name": "Omen", "description": ""}
+        ]
+
+
 class TestPrepareDemoWeek:
     def test_fills_deck_with_cards(self) -> None:
         engine = _make_engine()
@@ -149,6 +172,32 @@ class TestPrepareDemoWeek:
         assert len(engine.state.pending_death_cards) == 8
 
 
+class TestProcessBatchOutput:
+    def _batch(self):
+        from agents.schemas import ChoiceCardDef, InfoCardDef, WriterBatchOutput
+        return WriterBatchOutput(cards=[
+            InfoCardDef(id="welcome_message", title="W", description="", character="narrator"),
+            InfoCardDef(id="season_spring", title="S", description="", character="narrator"),
+            InfoCardDef(id="death_treasury_min", title="D", description="", character="narrator"),
+            InfoCardDef(title="Rumour", description="", character="narrator"),
+            ChoiceCardDef(title="C", description="", character="narrator", left_text="l", right_text="r"),
+        ])
+
+    def test_routes_structural_cards_on_season_start(self) -> None:
+        engine = _make_engine()
+        inserted = engine.process_batch_output(self._batch(), is_season_start=True)
+        assert inserted == 2
+        assert [c.title for c in engine.immediate_deque] == ["W", "S"]
+        assert list(engine.state.pending_death_cards) == ["death_treasury_min"]
+
+    def test_everything_goes_to_deck_mid_season(self) -> None:
+        engine = _make_engine()
+        inserted = engine.process_batch_output(self._batch(), is_season_start=False)
+        assert inserted == 5
+        assert not engine.immediate_deque
+        assert not engine.state.pending_death_cards
+
+
 class TestHandleDeath:
     def test_death_card_added_to_immediate_deque(self) -> None:
         engine = _make_engine()
@@ -170,6 +219,15 @@ class TestHandleDeath:
         engine.complete_resurrection()
         assert engine._awaiting_resurrection is False
 
+    def test_resurrect_keeps_only_fired_endings(self) -> None:
+        engine = _make_engine()
+        ending = next(n for n in engine.dag.nodes.values() if n.is_ending)
+        plain = next(n for n in engine.dag.nodes.values() if not n.is_ending)
+        ending.is_fired = plain.is_fired = True
+        engine.resurrect()
+        assert ending.is_fired is True
+        assert plain.is_fired is False
+
 
 class TestCheckEvents:
     def test_removes_finished_phase_event(self) -> None:
@@ -188,3 +246,38 @@ class TestCheckEvents:
         engine.events = [event]
         engine.check_events()
         assert len(engine.events) == 1
+
+    def test_condition_events_share_one_context(self) -> None:
+        from game.events import ConditionEvent
+        engine = _make_engine()
+        engine.events = [
+            ConditionEvent(id="a", name="A", description="", end_condition="'b' in events"),
+            ConditionEvent(id="b", name="B", description="", end_condition="stats['treasury'] > 60"),
+            ConditionEvent(id="c", name="C", description="", end_condition="not valid !!"),
+        ]
+        engine.check_events()
+        assert [e.id for e in engine.events] == ["b", "c"]
+
+    def test_removes_expired_timed_event(self) -> None:
+        from game.events import TimedEvent
+        engine = _make_engine()
+        s = engine.state
+        engine.events = [
+            TimedEvent(id="past", name="P", description="", deadline=[s.day, s.season_index, s.year]),
+            TimedEvent(id="future", name="F", description="", deadline=[s.day, s.season_index, s.year + 1]),
+        ]
+        engine.check_events()
+        assert [e.id for e in engine.events] == ["future"]
+
+
+class TestEventsForDisplay:
+    def test_progress_reflects_current_state(self) -> None:
+        from game.events import ProgressEvent
+        engine = _make_engine()
+        event = ProgressEvent(id="quest", name="Q", description="", target=5, progress_label="Gold")
+        engine.events = [event]
+        before = engine.get_all_events_for_display()
+        event.update_progress(3)
+        after = engine.get_all_events_for_display()
+        assert before[0]["type"] == "progress"
+        assert before[0]["progress"] != after[0]["progress"]
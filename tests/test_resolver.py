@@ -165,6 +165,18 @@ class TestRemoveEvent:
         executor.execute([_fc("remove_event", event_id="war")])
         assert len(events) == 0
 
+    def test_event_added_then_updated_in_same_batch(self) -> None:
+        state = _make_state()
+        events: list = []
+        executor = ActionExecutor(state, events)
+        executor.execute([
+            _fc("add_event", type="progress", event_id="quest", target=5),
+            _fc("update_event_progress", event_id="quest", delta=2),
+            _fc("remove_event", event_id="quest"),
+            _fc("update_event_progress", event_id="quest", delta=2),
+        ])
+        assert events == []
+
 
 class TestResolveCard:
     def test_resolve_choice_card_left(self) -> None:
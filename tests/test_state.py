@@ -8,6 +8,7 @@ from game.state import (
     DAYS_PER_WEEK,
     SEASONS_PER_YEAR,
     GlobalBlackboard,
+    NPC,
     Season,
     StatDefinition,
 )
@@ -71,6 +72,26 @@ class TestAdvanceDay:
         assert state.year == 2
 
 
+class TestAdvanceDays:
+    @pytest.mark.parametrize("n", [0, 1, 6, 7, 27, 28, 29, 113, 250])
+    @pytest.mark.parametrize("day,turn,season_index", [(1, 0, 0), (28, 6, 3), (15, 3, 2)])
+    def test_matches_repeated_advance_day(self, n: int, day: int, turn: int, season_index: int) -> None:
+        stepped = _make_state()
+        batched = _make_state()
+        for s in (stepped, batched):
+            s.day, s.turn, s.season_index = day, turn, season_index
+
+        expected = {"week_end": False, "season_end": False}
+        for _ in range(n):
+            for key, hit in stepped.advance_day().items():
+                expected[key] = expected[key] or hit
+
+        assert batched.advance_days(n) == expected
+        assert (batched.day, batched.turn, batched.season_index, batched.year) == (
+            stepped.day, stepped.turn, stepped.season_index, stepped.year,
+        )
+
+
 class TestElapsedDays:
     def test_zero_at_start(self) -> None:
         state = _make_state()
@@ -121,3 +142,25 @@ class TestGetStatHelpers:
     def test_get_stat_icon_unknown_returns_question_mark(self) -> None:
         state = _make_state()
         assert state.get_stat_icon("nonexistent") == "?"
+
+
+class TestNpcById:
+    def test_tracks_replaced_and_appended_npc_lists(self) -> None:
+        state = _make_state()
+        assert state.npc_by_id == {}
+        state.npcs = [NPC(id="a", name="A", role="", description="")]
+        assert list(state.npc_by_id) == ["a"]
+        state.npcs.append(NPC(id="b", name="B", role="", description=""))
+        assert list(state.npc_by_id) == ["a", "b"]
+
+
+class TestStatDefById:
+    def test_name_and_icon_follow_replaced_defs(self) -> None:
+        state = _make_state()
+        assert state.get_stat_name("treasury") == "Treasury"
+        assert state.get_stat_icon("military") == "⚔️"
+        assert state.get_stat_name("unknown") == "unknown"
+        assert state.get_stat_icon("unknown") == "?"
+        state.stat_defs = [StatDefinition(id="treasury", name="Coffers", description="", icon="🪙")]
+        assert state.get_stat_name("treasury") == "Coffers"
+        assert state.get_stat_name("military") == "military"
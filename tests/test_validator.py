@@ -1,11 +1,13 @@
 """Tests for cards.validator.validate_card_def."""
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from agents.schemas import ChoiceCardDef, FunctionCall, InfoCardDef
 from cards.models import ChoiceCard, InfoCard
-from cards.validator import validate_card_def
+from cards.validator import validate_card_def, validate_card_defs
 from game.state import GlobalBlackboard, NPC, StatDefinition
 
 
@@ -101,3 +103,48 @@ class TestValidateInfoCardDef:
         assert isinstance(card, InfoCard)
         assert len(card.next_cards) == 1
         assert isinstance(card.next_cards[0], InfoCard)
+
+    def test_deep_next_card_chain_does_not_recurse(self) -> None:
+        state = _make_state()
+        depth = 2 * sys.getrecursionlimit()
+        cd = InfoCardDef(title="0", description="", character="narrator")
+        for i in range(1, depth):
+            cd = InfoCardDef(title=str(i), description="", character="narrator", next_cards=[cd])
+        card = validate_card_def(cd, state)
+        length = 1
+        while card.next_cards:
+            card = card.next_cards[0]
+            length += 1
+        assert length == depth
+        assert card.title == "0"
+
+
+class TestValidateTreeCards:
+    def test_tree_children_follow_their_choice(self) -> None:
+        state = _make_state()
+        cd = _choice_def()
+        cd.tree_left = [InfoCardDef(title="a", description="", character="narrator")]
+        cd.tree_right = [
+            InfoCardDef(title="b", description="", character="narrator"),
+            InfoCardDef(title="c", description="", character="narrator"),
+        ]
+        card = validate_card_def(cd, state)
+        assert isinstance(card, ChoiceCard)
+        by_text = {
+            card.left.text: [c.title for c in card.tree_left],
+            card.right.text: [c.title for c in card.tree_right],
+        }
+        assert by_text == {"Left": ["a"], "Right": ["b", "c"]}
+
+
+class TestValidateCardDefsBatch:
+    def test_converts_each_def_in_order(self) -> None:
+        state = _make_state()
+        defs = [
+            _choice_def(npc="chancellor"),
+            InfoCardDef(title="info", description="", character="ghost"),
+            _choice_def(),
+        ]
+        cards = validate_card_defs(defs, state)
+        assert [type(c) for c in cards] == [ChoiceCard, InfoCard, ChoiceCard]
+        assert [c.character for c in cards] == ["chancellor", "narrator", "narrator"]
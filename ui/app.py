@@ -18,6 +18,7 @@ class WorldCardApp(App):
         self.theme_choice: str = ""
         self.stat_count: int = 4
         self.language: str = "en"
+        self.writer = None  # Built once per game, after the world exists
 
     def on_mount(self) -> None:
         from ui.screens.title import TitleScreen
@@ -30,6 +31,7 @@ class WorldCardApp(App):
         self.demo_mode = demo
         self.language = language
         self.engine = GameEngine()
+        self.writer = None
 
         from ui.screens.loading import LoadingScreen
 
@@ -1,6 +1,8 @@
 """Cheat mode overlay — shows card effects and queued card list."""
 from __future__ import annotations
 
+from itertools import islice
+
 from rich.console import Group
 from rich.rule import Rule
 from rich.text import Text
@@ -96,17 +98,17 @@ class CheatScreen(ModalScreen):
         sections.append(Rule(style="bright_black"))
 
         # ── Deque contents ───────────────────────────────────────────────
-        all_cards = self._deck.peek_all()
+        deck_count = self._deck.count
         q_title = Text()
         q_title.append("Weighted Deque", style="bold white")
-        q_title.append(f"  ({self._deck.count} cards, cap {self._deck.capacity})", style="dim")
+        q_title.append(f"  ({deck_count} cards, cap {self._deck.capacity})", style="dim")
         sections.append(q_title)
         sections.append(Text())
 
-        if not all_cards:
+        if not deck_count:
             sections.append(Text("  Deque is empty", style="dim italic"))
         else:
-            for idx, c in enumerate(all_cards[:12], 1):
+            for idx, c in enumerate(islice(self._deck.iter_top_down(), 12), 1):
                 label, label_style = _SOURCE_LABEL.get(c.source, ("CARD", "dim"))
                 row = Text()
                 row.append(f"  {idx}.  ", style="bold")
@@ -114,8 +116,8 @@ class CheatScreen(ModalScreen):
                 row.append(f"  p={c.priority}  ", style="dim")
                 row.append(f"{c.title}\n", style="white")
                 sections.append(row)
-            if len(all_cards) > 12:
-                sections.append(Text(f"  ... and {len(all_cards) - 12} more", style="dim"))
+            if deck_count > 12:
+                sections.append(Text(f"  ... and {deck_count - 12} more", style="dim"))
 
         sections.append(Rule(style="bright_black"))
 
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import random
-
 from textual.app import ComposeResult
 from textual.containers import Center, Middle, Vertical
 from textual.screen import Screen
@@ -119,7 +117,7 @@ class LoadingScreen(Screen):
 
         if self._is_demo:
             # Fast path: load demo world with simulated progress
-            from game.demo import get_demo_world, get_demo_card_pool
+            from game.demo import get_demo_world, sample_demo_cards
 
             self._step_titles = [
                 "Loading the Kingdom of Ardenvale...",
@@ -137,9 +135,7 @@ class LoadingScreen(Screen):
             engine.build_from_schema(world, app.stat_count)
             self._advance_step()
 
-            pool = get_demo_card_pool()
-            random.shuffle(pool)
-            engine.deque.bulk_insert(pool[:engine.deque.capacity])
+            engine.deque.bulk_insert(sample_demo_cards(engine.deque.capacity))
             self._advance_step()
 
         else:
@@ -182,52 +178,16 @@ class LoadingScreen(Screen):
                 cost_tracker=app.cost_tracker,
                 language=getattr(app, "language", "en"),
             )
+            app.writer = writer
 
             common_count = engine.deque.capacity
             jobs = engine.job_queue.drain()
             context = engine.get_generation_context()
             is_season_start = context.get("is_season_start", False)
 
-            batch_output = await writer.generate_batch(common_count, jobs, context)
-
-            from agents.schemas import InfoCardDef
-            from cards.validator import validate_card_def
-
-            deck_cards = []
-
-            for cd in batch_output.cards:
-                card_id = getattr(cd, "id", "") or ""
-
-                if isinstance(cd, InfoCardDef):
-                    if is_season_start:
-                        if card_id == "welcome_message":
-                            engine.state.welcome_card = validate_card_def(cd, engine.state)
-                            continue
-                        if card_id.startswith("reborn_"):
-                            engine.state.reborn_card = validate_card_def(cd, engine.state)
-                            continue
-                        if card_id.startswith("season_"):
-                            engine.state.season_start_card = validate_card_def(cd, engine.state)
-                            continue
-                        if card_id.startswith("death_"):
-                            engine.state.pending_death_cards[card_id] = validate_card_def(cd, engine.state)
-                            continue
-
-                deck_cards.append(cd)
-
-            engine.add_cards_from_defs(deck_cards)
-            
-            if is_season_start:
-                if engine.state.season_start_card:
-                    engine.immediate_deque.appendleft(engine.state.season_start_card)
-                    engine.state.season_start_card = None
-                if engine.state.reborn_card:
-                    engine.immediate_deque.appendleft(engine.state.reborn_card)
-                    engine.state.reborn_card = None
-                if engine.state.welcome_card:
-                    engine.immediate_deque.appendleft(engine.state.welcome_card)
-                    engine.state.welcome_card = None
-                engine.state.is_first_day_after_death = False
+            batch_output = await writer.generate_batch_parallel(common_count, jobs, context)
+
+            engine.process_batch_output(batch_output, is_season_start)
 
             cost_text = f"Total: {app.cost_tracker.summary}"
             self.query_one("#loading-cost").update(cost_text)